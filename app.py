@@ -1,8 +1,56 @@
+import math
 import streamlit as st
 import numpy as np
 import st_paywall as st_pw # Importing st_paywall with an alias for clarity
 
+# Number of past tau_E values kept per model in the session history ring buffer.
+HISTORY_LENGTH = 512
+
+# --- Model Constants ---
+# Minimum floor for the diffusion coefficient.
+# Diffusion cannot be zero or negative in a physical system.
+# This value (1e-4 m^2/s) is a very small positive number,
+# representing a baseline minimum diffusion rate.
+_MIN_DIFF_FLOOR = 1e-4 # m^2/s (adjust if a different physical minimum is known)
+
+# Arbitrary constants for comparative scaling of the Bohm and Neoclassical laws
+# in this simplified model. A typical factor for Bohm is k_B / (16 * e) or
+# similar, leading to ~1/16 T/B.
+_SCALE_BOHM = 1.0
+_SCALE_NEO = 0.1
+
+# Characteristic minor radius 'a' of the plasma in meters
+# (e.g., typical for a medium-sized tokamak).
+_A_MINOR = 1.0
+
 # --- Define the UN-EX Calculation Function ---
+# The model uses only array-friendly arithmetic, so the same function evaluates
+# either a single operating point or a whole parameter sweep (e.g. an array of T).
+def _unex_model(T, B, E_harmonic, S_local, alpha_coeff, beta_coeff, gamma_coeff):
+    # Ensure S_local (normalized turbulence proxy) is not negative,
+    # as physical turbulence intensity should be non-negative.
+    # 0.5 * (S + |S|) equals max(S, 0) without a branch, and works unchanged
+    # for both floats and NumPy arrays.
+    S_local_adjusted = 0.5 * (S_local + abs(S_local))
+
+    # Calculate the diffusion coefficient using the provided linear model.
+    diffusion_coefficient = (alpha_coeff * (T / B)) - (beta_coeff * E_harmonic) + (gamma_coeff * S_local_adjusted)
+
+    # Return the maximum of the calculated coefficient and the floor,
+    # ensuring the result is always physically valid. The builtin max keeps the
+    # single operating point as a plain float; sweeps use the np.maximum ufunc.
+    if isinstance(diffusion_coefficient, np.ndarray):
+        return np.maximum(diffusion_coefficient, _MIN_DIFF_FLOOR)
+    return max(diffusion_coefficient, _MIN_DIFF_FLOOR)
+
+
+# Memoized scalar path. st.cache_data persists across reruns (Streamlit
+# re-executes the script each time, so a module-level functools cache would
+# start empty on every run). Sliders only produce values on their fixed step
+# grid, so revisited operating points hit the cache without rounding the keys.
+_unex_pure = st.cache_data(max_entries=1024, show_spinner=False)(_unex_model)
+
+
 def calculate_unex_diffusion(T, B, E_harmonic, S_local, alpha_coeff, beta_coeff, gamma_coeff, delta):
     """
     Calculates the UN-EX diffusion coefficient based on the simplified linear model:
@@ -12,11 +60,15 @@ def calculate_unex_diffusion(T, B, E_harmonic, S_local, alpha_coeff, beta_coeff,
     coefficient to prevent non-physical negative or zero values, as diffusion
     must always be positive in a physical system.
 
+    Any of the plasma inputs (T, B, E_harmonic, S_local) may be passed as a
+    NumPy array instead of a float, in which case the model is evaluated
+    element-wise with broadcasting and an array of the same shape is returned.
+
     Parameters:
-    T (float): Plasma Temperature in keV.
-    B (float): Magnetic Field in Tesla.
-    E_harmonic (float): Harmonic Feedback Energy.
-    S_local (float): Local Entropy Proxy (normalized turbulence).
+    T (float or np.ndarray): Plasma Temperature in keV.
+    B (float or np.ndarray): Magnetic Field in Tesla.
+    E_harmonic (float or np.ndarray): Harmonic Feedback Energy.
+    S_local (float or np.ndarray): Local Entropy Proxy (normalized turbulence).
     alpha_coeff (float): Tunable coefficient for the T/B term.
     beta_coeff (float): Tunable coefficient for the E_harmonic term.
     gamma_coeff (float): Tunable coefficient for the S_local term.
@@ -24,57 +76,178 @@ def calculate_unex_diffusion(T, B, E_harmonic, S_local, alpha_coeff, beta_coeff,
                    legacy from older model forms (its direct role here is minimal).
 
     Returns:
-    float: The calculated UN-EX Diffusion Coefficient in m^2/s,
-           guaranteed to be at least min_diffusion_floor.
+    float or np.ndarray: The calculated UN-EX Diffusion Coefficient in m^2/s,
+           guaranteed to be at least _MIN_DIFF_FLOOR.
     """
-    # Ensure S_local (normalized turbulence proxy) is not negative,
-    # as physical turbulence intensity should be non-negative.
-    S_local_adjusted = max(0.0, S_local)
+    # Array sweeps bypass the cache, which would otherwise hash every input
+    # array and pickle each result array into storage; a single operating
+    # point is served from the memoized path.
+    if any(isinstance(x, np.ndarray) for x in (T, B, E_harmonic, S_local)):
+        return _unex_model(T, B, E_harmonic, S_local, alpha_coeff, beta_coeff, gamma_coeff)
+    return _unex_pure(T, B, E_harmonic, S_local, alpha_coeff, beta_coeff, gamma_coeff)
 
-    # Calculate the diffusion coefficient using the provided linear model.
-    diffusion_coefficient = (alpha_coeff * (T / B)) - (beta_coeff * E_harmonic) + (gamma_coeff * S_local_adjusted)
 
-    # Define a minimum floor for the diffusion coefficient.
-    # Diffusion cannot be zero or negative in a physical system.
-    # This value (1e-4 m^2/s) is a very small positive number,
-    # representing a baseline minimum diffusion rate.
-    min_diffusion_floor = 1e-4 # m^2/s (adjust if a different physical minimum is known)
+# --- Define the Comparison Scaling Laws ---
+@st.cache_data(max_entries=1024)
+def calculate_comparisons(T, B, a):
+    """
+    Calculates the Bohm and Neoclassical reference diffusion coefficients and
+    their corresponding energy confinement times (tau_E ~ a^2 / D).
 
-    # Return the maximum of the calculated coefficient and the floor,
-    # ensuring the result is always physically valid.
-    return max(diffusion_coefficient, min_diffusion_floor)
+    Parameters:
+    T (float): Plasma Temperature in keV.
+    B (float): Magnetic Field in Tesla.
+    a (float): Characteristic plasma minor radius in meters.
+
+    Returns:
+    tuple: (D_Bohm, tau_E_bohm, D_Neoclassical, tau_E_neoclassical)
+    """
+    # --- Bohm Confinement ---
+    # Simplified Bohm diffusion coefficient (D_Bohm ~ T/B).
+    # Here, '_SCALE_BOHM' is a placeholder for a numerical constant.
+    D_Bohm = _SCALE_BOHM * (T / B)
+    tau_E_bohm = (a**2) / D_Bohm
+
+    # --- Neoclassical Confinement ---
+    # Simplified Neoclassical diffusion coefficient (D_Neoclassical ~ T^0.5 / B^2).
+    # This is a very rough simplification; actual neoclassical diffusion is complex
+    # and highly dependent on collisionality regimes (banana, plateau, Pfirsch-Schlüter).
+    D_Neoclassical = _SCALE_NEO * math.sqrt(T) / (B * B)
+    tau_E_neoclassical = (a**2) / D_Neoclassical
+
+    return D_Bohm, tau_E_bohm, D_Neoclassical, tau_E_neoclassical
+
+
+# --- Define the Temperature Sweep Kernel ---
+# Numba is only imported, and the kernel only compiled, the first time a sweep
+# is requested in this process, which keeps it off every script rerun.
+# st.cache_resource shares the single compiled kernel across all sessions
+# served by this process; cache=True below also persists it across restarts.
+@st.cache_resource(show_spinner="Compiling the temperature sweep kernel...")
+def get_sweep_kernel():
+    """
+    Returns the compiled temperature sweep kernel, building it on first use.
+    """
+    from numba import njit
+
+    # Compiled eagerly for an explicit signature when this factory runs, which
+    # st.cache_resource limits to once per process (cache=True additionally
+    # lets a restarted process load it from disk). The module-level constants
+    # are frozen into the compiled code as literals. A single loop fills all
+    # three confinement times per temperature point, instead of allocating one
+    # temporary array per operator.
+    @njit("float64[:, :](float64[:], float64, float64, float64, float64, float64, float64, float64)",
+          cache=True, fastmath=True)
+    def sweep_confinement_times(T_arr, B, E_harmonic, S_local, a, alpha_coeff, beta_coeff, gamma_coeff):
+        """
+        Evaluates the UN-EX, Bohm and Neoclassical energy confinement times over
+        an array of plasma temperatures, with all other parameters held fixed.
+
+        Parameters:
+        T_arr (np.ndarray): Plasma Temperatures in keV (1-D, float64).
+        B (float): Magnetic Field in Tesla.
+        E_harmonic (float): Harmonic Feedback Energy.
+        S_local (float): Local Entropy Proxy (normalized turbulence).
+        a (float): Characteristic plasma minor radius in meters.
+        alpha_coeff (float): Tunable coefficient for the T/B term.
+        beta_coeff (float): Tunable coefficient for the E_harmonic term.
+        gamma_coeff (float): Tunable coefficient for the S_local term.
+
+        Returns:
+        np.ndarray: Array of shape (3, len(T_arr)) holding tau_E_UNEX, tau_E_Bohm
+                    and tau_E_Neoclassical (in seconds) for each temperature.
+        """
+        n = T_arr.size
+        out = np.empty((3, n))
+        a2 = a * a
+        S_local_adjusted = max(S_local, 0.0)
+        # Hoist everything that does not depend on T out of the loop, so the loop
+        # body multiplies by the reciprocal of B instead of dividing by B.
+        alpha_inv_B = alpha_coeff / B
+        D_offset = gamma_coeff * S_local_adjusted - beta_coeff * E_harmonic
+        tau_bohm_coeff = a2 * B / _SCALE_BOHM
+        tau_neo_coeff = a2 * B * B / _SCALE_NEO
+        for i in range(n):
+            t = T_arr[i]
+            # Same model and floor as calculate_unex_diffusion.
+            d = max(alpha_inv_B * t + D_offset, _MIN_DIFF_FLOOR)
+            out[0, i] = a2 / d
+            # Bohm and Neoclassical reference scalings, as in calculate_comparisons.
+            out[1, i] = tau_bohm_coeff / t
+            out[2, i] = tau_neo_coeff / math.sqrt(t)
+        return out
+
+    return sweep_confinement_times
+
+
+# --- Stripe Secrets ---
+# Memoized with st.cache_resource so the nested st.secrets lookup runs once per
+# process rather than on every rerun (a plain functools.lru_cache would be
+# rebuilt empty each time Streamlit re-executes the script). A missing key
+# raises KeyError, which is not cached.
+@st.cache_resource(show_spinner=False)
+def _stripe_secrets():
+    """
+    Returns the (publishable_key, api_key, product_id) triple from the
+    '[stripe]' section of the Streamlit secrets.
+    """
+    # st.secrets is the standard way to access secrets in Streamlit.
+    # It looks for .streamlit/secrets.toml or secrets configured in the cloud.
+    stripe_secrets = st.secrets["stripe"]
+    return stripe_secrets["publishable_key"], stripe_secrets["api_key"], stripe_secrets["product_id"]
 
 
 def main():
+    # Page configuration must be the first Streamlit call of the script run.
+    # The wide layout keeps results in the main area while the parameter
+    # sliders live in the sidebar.
+    st.set_page_config(page_title="UN-EX Fusion", layout="wide", initial_sidebar_state="expanded")
+
     # --- Stripe Paywall Integration ---
     # This block is now ACTIVATED. It expects your Stripe secrets
     # (publishable_key, api_key, and product_id) to be correctly
     # configured in your .streamlit/secrets.toml file and/or
     # in the Streamlit Cloud app's 'Secrets' dashboard setting.
-    try:
-        # st.secrets is the standard way to access secrets in Streamlit.
-        # It looks for .streamlit/secrets.toml or secrets configured in the cloud.
-        if not st_pw.stripe_auth(
-            publishable_key=st.secrets["stripe"]["publishable_key"],
-            secret_key=st.secrets["stripe"]["api_key"],
-            product_id=st.secrets["stripe"]["product_id"]
-        ):
-            # If authentication fails, display a warning and stop the app execution.
-            st.warning("Access denied. Please complete the payment to proceed to the UN-EX Fusion Simulator.")
+    # The Stripe check involves a network round-trip, so it is only performed
+    # until it succeeds once; the result is then kept in st.session_state.
+    if not st.session_state.get("unex_paid"):
+        try:
+            publishable_key, api_key, product_id = _stripe_secrets()
+            if not st_pw.stripe_auth(
+                publishable_key=publishable_key,
+                secret_key=api_key,
+                product_id=product_id
+            ):
+                # If authentication fails, display a warning and stop the app execution.
+                st.warning("Access denied. Please complete the payment to proceed to the UN-EX Fusion Simulator.")
+                st.stop()
+            # Remember the successful check so later reruns in this session skip it.
+            st.session_state["unex_paid"] = True
+        except KeyError as e:
+            # This error occurs if a required key (like 'publishable_key') is missing
+            # from the '[stripe]' section in your secrets.toml.
+            st.error(f"Configuration Error: Missing Stripe secret in .streamlit/secrets.toml. "
+                     f"Please ensure you have '[stripe]' section with '{e.args[0]}' defined. "
+                     f"Consult the st-paywall documentation for exact required keys.")
+            st.stop()
+        except Exception as e:
+            # Catch any other unexpected errors during paywall initialization.
+            st.error(f"An unexpected error occurred during paywall initialization: {e}")
             st.stop()
-    except KeyError as e:
-        # This error occurs if a required key (like 'publishable_key') is missing
-        # from the '[stripe]' section in your secrets.toml.
-        st.error(f"Configuration Error: Missing Stripe secret in .streamlit/secrets.toml. "
-                 f"Please ensure you have '[stripe]' section with '{e.args[0]}' defined. "
-                 f"Consult the st-paywall documentation for exact required keys.")
-        st.stop()
-    except Exception as e:
-        # Catch any other unexpected errors during paywall initialization.
-        st.error(f"An unexpected error occurred during paywall initialization: {e}")
-        st.stop()
     # --- End Paywall Integration ---
 
+    # Preallocate a fixed-size ring buffer for the tau_E history of this session,
+    # so memory stays bounded no matter how many simulations are run. Each model
+    # gets its own contiguous array (rather than one array of tuples), so the
+    # series can be compared against each other in a single vectorized pass.
+    if "hist" not in st.session_state:
+        st.session_state.hist = {
+            "unex": np.zeros(HISTORY_LENGTH, dtype=np.float32),
+            "bohm": np.zeros(HISTORY_LENGTH, dtype=np.float32),
+            "neo": np.zeros(HISTORY_LENGTH, dtype=np.float32),
+            "i": 0,
+        }
+
     # If the user has authenticated successfully (or if the app is run locally
     # without a paywall, for development), proceed with the main app content.
     st.title("UN-EX Fusion Simulator - Full Access")
@@ -84,42 +257,76 @@ def main():
     # This section contains the interactive sliders, calculations, and comparisons
     # for the UN-EX Fusion Model, as per your design.
 
-    st.header("1. Tunable Plasma Parameters")
-
-    # Interactive sliders allow the user to adjust key plasma and model parameters.
-    # Each slider includes a 'help' tooltip for user guidance.
-    T = st.slider("Plasma Temperature (T) [keV]", min_value=1.0, max_value=50.0, value=10.0, step=0.5,
-                  help="Core plasma temperature. Higher temperatures generally lead to faster fusion reactions but also increased transport.")
-    B = st.slider("Magnetic Field (B) [T]", min_value=0.5, max_value=20.0, value=5.0, step=0.1,
-                  help="Strength of the confining magnetic field. Stronger fields typically improve confinement.")
-    E_harmonic = st.slider("Harmonic Feedback Energy (E_harmonic)", min_value=0.0, max_value=10.0, value=1.0, step=0.1,
-                           help="Injected energy tuned to resonant plasma modes, aiming to suppress turbulence. Higher values are expected to reduce diffusion.")
-    S_local = st.slider("Local Entropy Proxy (S_local)", min_value=0.0, max_value=1.0, value=0.50, step=0.01,
-                        help="A normalized proxy for local plasma turbulence or disorder. Lower values represent reduced turbulence and are desired for better confinement.")
-
-    # Tunable response coefficients for the UN-EX diffusion model.
-    alpha_coeff = st.slider("Coefficient alpha (α) for T/B term", min_value=0.1, max_value=10.0, value=1.0, step=0.1,
-                            help="Scaling factor for the baseline Bohm-like diffusion component (T/B).")
-    beta_coeff = st.slider("Coefficient beta (β) for E_harmonic term", min_value=0.0, max_value=5.0, value=1.0, step=0.1,
-                           help="Determines the effectiveness of Harmonic Feedback Energy in reducing diffusion. Higher β means more impact.")
-    gamma_coeff = st.slider("Coefficient gamma (γ) for S_local term", min_value=0.0, max_value=5.0, value=1.0, step=0.1,
-                            help="Determines how much local entropy (turbulence) increases diffusion. Higher γ means more impact.")
-
-    # Small constant for numerical stability, from previous model forms.
-    delta = st.slider("Small constant delta (δ)", min_value=0.001, max_value=0.1, value=0.01, step=0.001, format="%.3f",
-                      help="A small positive constant to avoid potential division by zero if S_local approaches zero, or for other numerical stability reasons.")
+    st.sidebar.header("1. Tunable Plasma Parameters")
 
-    st.header("2. UN-EX Model Calculations")
+    # The sliders live inside a sidebar form so that dragging them does not
+    # trigger a full rerun on every intermediate value; the model is only
+    # recalculated once the user presses the submit button.
+    with st.sidebar.form("unex_params"):
+        # Interactive sliders allow the user to adjust key plasma and model parameters.
+        # Each slider includes a 'help' tooltip for user guidance.
+        T = st.slider("Plasma Temperature (T) [keV]", min_value=1.0, max_value=50.0, value=10.0, step=0.5,
+                      help="Core plasma temperature. Higher temperatures generally lead to faster fusion reactions but also increased transport.")
+        B = st.slider("Magnetic Field (B) [T]", min_value=0.5, max_value=20.0, value=5.0, step=0.1,
+                      help="Strength of the confining magnetic field. Stronger fields typically improve confinement.")
+        E_harmonic = st.slider("Harmonic Feedback Energy (E_harmonic)", min_value=0.0, max_value=10.0, value=1.0, step=0.1,
+                               help="Injected energy tuned to resonant plasma modes, aiming to suppress turbulence. Higher values are expected to reduce diffusion.")
+        S_local = st.slider("Local Entropy Proxy (S_local)", min_value=0.0, max_value=1.0, value=0.50, step=0.01,
+                            help="A normalized proxy for local plasma turbulence or disorder. Lower values represent reduced turbulence and are desired for better confinement.")
+
+        # Tunable response coefficients for the UN-EX diffusion model.
+        alpha_coeff = st.slider("Coefficient alpha (α) for T/B term", min_value=0.1, max_value=10.0, value=1.0, step=0.1,
+                                help="Scaling factor for the baseline Bohm-like diffusion component (T/B).")
+        beta_coeff = st.slider("Coefficient beta (β) for E_harmonic term", min_value=0.0, max_value=5.0, value=1.0, step=0.1,
+                               help="Determines the effectiveness of Harmonic Feedback Energy in reducing diffusion. Higher β means more impact.")
+        gamma_coeff = st.slider("Coefficient gamma (γ) for S_local term", min_value=0.0, max_value=5.0, value=1.0, step=0.1,
+                                help="Determines how much local entropy (turbulence) increases diffusion. Higher γ means more impact.")
+
+        # Small constant for numerical stability, from previous model forms.
+        delta = st.slider("Small constant delta (δ)", min_value=0.001, max_value=0.1, value=0.01, step=0.001, format="%.3f",
+                          help="A small positive constant to avoid potential division by zero if S_local approaches zero, or for other numerical stability reasons.")
 
-    # Calculate the UN-EX Diffusion Coefficient using the defined function.
-    D_UNEX = calculate_unex_diffusion(T, B, E_harmonic, S_local, alpha_coeff, beta_coeff, gamma_coeff, delta)
-    st.write(f"**UN-EX Diffusion Coefficient (D_UNEX):** `{D_UNEX:.4e}` m²/s") # Using scientific notation for D_UNEX
+        submitted = st.form_submit_button("Run simulation")
 
     # Assume a characteristic minor radius 'a' for the plasma.
     # Confinement time (tau_E) is typically proportional to a^2 / D.
-    a = 1.0  # Example minor radius in meters (e.g., typical for a medium-sized tokamak)
-    tau_E_unex = (a**2) / D_UNEX
-    st.write(f"**UN-EX Energy Confinement Time (τ_E_UNEX):** `{tau_E_unex:.4f}` s")
+    a = _A_MINOR
+
+    # Recalculate only when the form is submitted (or on the very first load),
+    # and keep the last results in st.session_state so they survive reruns
+    # triggered by anything other than the submit button.
+    if submitted or "D_UNEX" not in st.session_state:
+        # Calculate the UN-EX Diffusion Coefficient using the defined function.
+        D_UNEX = calculate_unex_diffusion(T, B, E_harmonic, S_local, alpha_coeff, beta_coeff, gamma_coeff, delta)
+        tau_E_unex = (a**2) / D_UNEX
+
+        # Bohm and Neoclassical reference values (cached alongside D_UNEX).
+        D_Bohm, tau_E_bohm, D_Neoclassical, tau_E_neoclassical = calculate_comparisons(T, B, a)
+
+        st.session_state["D_UNEX"] = D_UNEX
+        st.session_state["tau_E_unex"] = tau_E_unex
+        st.session_state["tau_E_bohm"] = tau_E_bohm
+        st.session_state["tau_E_neoclassical"] = tau_E_neoclassical
+
+        # Record the new results in the history ring buffer.
+        hist = st.session_state.hist
+        slot = hist["i"] % HISTORY_LENGTH
+        hist["unex"][slot] = tau_E_unex
+        hist["bohm"][slot] = tau_E_bohm
+        hist["neo"][slot] = tau_E_neoclassical
+        hist["i"] += 1
+
+    D_UNEX = st.session_state["D_UNEX"]
+    tau_E_unex = st.session_state["tau_E_unex"]
+    tau_E_bohm = st.session_state["tau_E_bohm"]
+    tau_E_neoclassical = st.session_state["tau_E_neoclassical"]
+
+    st.header("2. UN-EX Model Calculations")
+
+    # All results are emitted as one markdown block (one element per rerun).
+    # Scientific notation is used for D_UNEX.
+    st.markdown(f"**UN-EX Diffusion Coefficient (D_UNEX):** `{D_UNEX:.4e}` m²/s\n\n"
+                f"**UN-EX Energy Confinement Time (τ_E_UNEX):** `{tau_E_unex:.4f}` s")
 
     # Placeholder for Q-ratio calculation.
     # A full Q-ratio calculation requires detailed power balance, plasma density,
@@ -129,49 +336,58 @@ def main():
 
 
     st.header("3. Confinement Comparison")
-    st.write("Comparing UN-EX confinement against generalized Bohm and Neoclassical scaling laws.")
-
-    # --- Bohm Confinement ---
-    # Simplified Bohm diffusion coefficient (D_Bohm ~ T/B).
-    # A typical factor for Bohm is k_B / (16 * e) or similar, leading to ~1/16 T/B.
-    # Here, 'scaling_factor_bohm' is a placeholder for a numerical constant.
-    scaling_factor_bohm = 1.0 # Arbitrary constant for comparative scaling in this simplified model.
-    D_Bohm = scaling_factor_bohm * (T / B)
-    tau_E_bohm = (a**2) / D_Bohm
-    st.write(f"**Bohm Confinement Time (τ_E_Bohm):** `{tau_E_bohm:.4f}` s")
-
-    # --- Neoclassical Confinement ---
-    # Simplified Neoclassical diffusion coefficient (D_Neoclassical ~ T^0.5 / B^2).
-    # This is a very rough simplification; actual neoclassical diffusion is complex
-    # and highly dependent on collisionality regimes (banana, plateau, Pfirsch-Schlüter).
-    scaling_factor_neoclassical = 0.1 # Arbitrary constant for comparative scaling.
-    D_Neoclassical = scaling_factor_neoclassical * (T**0.5 / B**2)
-    tau_E_neoclassical = (a**2) / D_Neoclassical
-    st.write(f"**Neoclassical Confinement Time (τ_E_Neoclassical):** `{tau_E_neoclassical:.4f}` s")
+    st.markdown("Comparing UN-EX confinement against generalized Bohm and Neoclassical scaling laws.\n\n"
+                f"**Bohm Confinement Time (τ_E_Bohm):** `{tau_E_bohm:.4f}` s\n\n"
+                f"**Neoclassical Confinement Time (τ_E_Neoclassical):** `{tau_E_neoclassical:.4f}` s")
 
     st.subheader("Confinement Time Performance")
     # Compare UN-EX confinement time with Bohm and Neoclassical.
+    # Both verdicts are emitted as one markdown element, each line keeping its
+    # own success (green) or info (blue) marker and colour.
     if tau_E_unex > tau_E_bohm:
-        st.success(f"**UN-EX τ_E ({tau_E_unex:.2f} s) is significantly better than Bohm τ_E ({tau_E_bohm:.2f} s)!** This suggests successful active transport suppression.")
+        bohm_verdict = f":white_check_mark: :green[**UN-EX τ_E ({tau_E_unex:.2f} s) is significantly better than Bohm τ_E ({tau_E_bohm:.2f} s)!** This suggests successful active transport suppression.]"
     else:
-        st.info(f"UN-EX τ_E ({tau_E_unex:.2f} s) is comparable to or worse than Bohm τ_E ({tau_E_bohm:.2f} s). Tuning of parameters might be needed for improvement.")
+        bohm_verdict = f":information_source: :blue[UN-EX τ_E ({tau_E_unex:.2f} s) is comparable to or worse than Bohm τ_E ({tau_E_bohm:.2f} s). Tuning of parameters might be needed for improvement.]"
 
     if tau_E_unex > tau_E_neoclassical:
-        st.success(f"**UN-EX τ_E ({tau_E_unex:.2f} s) is better than Neoclassical τ_E ({tau_E_neoclassical:.2f} s)!** This indicates the model's ability to outperform even collisional transport limits.")
+        neo_verdict = f":white_check_mark: :green[**UN-EX τ_E ({tau_E_unex:.2f} s) is better than Neoclassical τ_E ({tau_E_neoclassical:.2f} s)!** This indicates the model's ability to outperform even collisional transport limits.]"
     else:
-        st.info(f"UN-EX τ_E ({tau_E_unex:.2f} s) is comparable to or worse than Neoclassical τ_E ({tau_E_neoclassical:.2f} s). Further optimization may be required.")
+        neo_verdict = f":information_source: :blue[UN-EX τ_E ({tau_E_unex:.2f} s) is comparable to or worse than Neoclassical τ_E ({tau_E_neoclassical:.2f} s). Further optimization may be required.]"
+
+    st.markdown(f"{bohm_verdict}\n\n{neo_verdict}")
 
 
     st.header("4. Real-Time Confinement Plot")
-    # This plot currently shows only a single point reflecting the current UN-EX τ_E.
-    # To implement a "Q Sweep" over time or visualize historical performance,
-    # you would need to:
-    # a) Store past calculated tau_E values (e.g., in st.session_state).
-    # b) Implement a loop or simulation step that advances "time" and updates parameters (e.g., for the "smart loop").
-    # c) Plot the list of historical values.
-    # Example for current single point:
-    st.line_chart(np.array([[0, tau_E_unex]]), use_container_width=True)
-    st.markdown("*(This plot currently displays the instantaneous UN-EX τ_E at an arbitrary 'Time=0'. For dynamic 'Q Sweep' behavior or a time-series visualization, additional simulation logic to track and update values over iterations would be required.)*")
+    # Plot the τ_E of every simulation run in this session, oldest first.
+    # Until the ring buffer wraps these are zero-copy views of the filled slots;
+    # afterwards the buffers are rotated so the oldest surviving value comes first.
+    hist = st.session_state.hist
+    if hist["i"] <= HISTORY_LENGTH:
+        history = {k: hist[k][:hist["i"]] for k in ("unex", "bohm", "neo")}
+    else:
+        history = {k: np.roll(hist[k], -(hist["i"] % HISTORY_LENGTH)) for k in ("unex", "bohm", "neo")}
+    n_runs = len(history["unex"])
+    st.line_chart({"τ_E_UNEX [s]": history["unex"], "τ_E_Bohm [s]": history["bohm"],
+                   "τ_E_Neoclassical [s]": history["neo"]}, width="stretch")
+
+    # Compare the series element-wise in one vectorized operation each.
+    better_than_bohm = history["unex"] > history["bohm"]
+    better_than_neo = history["unex"] > history["neo"]
+    st.markdown(f"*(This plot shows the τ_E of the last {n_runs} simulation run(s) in this session, up to a maximum of {HISTORY_LENGTH}. "
+                f"UN-EX outperformed Bohm in {np.count_nonzero(better_than_bohm)} and Neoclassical in {np.count_nonzero(better_than_neo)} of them. "
+                f"Press 'Run simulation' with new parameters to extend the history.)*")
+
+    st.subheader("Temperature Sweep")
+    # Sweep the plasma temperature across the full slider range while keeping
+    # the other parameters fixed. The compiled kernel evaluates all three
+    # confinement times for the whole sweep in a single pass.
+    T_grid = np.linspace(1.0, 50.0, 200)
+    sweep_confinement_times = get_sweep_kernel()
+    tau_unex_grid, tau_bohm_grid, tau_neo_grid = sweep_confinement_times(
+        T_grid, B, E_harmonic, S_local, a, alpha_coeff, beta_coeff, gamma_coeff)
+    st.line_chart({"T [keV]": T_grid, "τ_E_UNEX [s]": tau_unex_grid,
+                   "τ_E_Bohm [s]": tau_bohm_grid, "τ_E_Neoclassical [s]": tau_neo_grid},
+                  x="T [keV]", width="stretch")
 
 
 # This ensures that the 'main' function is called when the script is executed.